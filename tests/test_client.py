@@ -1,77 +1,131 @@
-from datetime import UTC, datetime
-from functools import wraps
-from http import HTTPMethod
+from functools import cache
+from http import HTTPMethod, HTTPStatus
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import ANY, patch
 
-import requests_mock
-from requests import ConnectTimeout
+from requests import ConnectionError, ConnectTimeout, PreparedRequest, Response
+from requests.adapters import BaseAdapter
 
 import youtrack_sdk.client
 from youtrack_sdk.client import Client
-from youtrack_sdk.entities import (
-    Agile,
-    AgileRef,
-    DurationValue,
-    Issue,
-    IssueAttachment,
-    IssueComment,
-    IssueLink,
-    IssueLinkType,
-    IssueWorkItem,
-    Project,
-    Sprint,
-    SprintRef,
-    Tag,
-    User,
-    WorkItemType,
-)
 
 from .test_definitions import (
     TEST_AGILE,
+    TEST_AGILES,
     TEST_CUSTOM_ISSUE,
     TEST_CUSTOM_ISSUE_2,
     TEST_ISSUE,
     TEST_ISSUE_2,
+    TEST_ISSUE_COMMENTS,
+    TEST_ISSUE_LINK_TYPES,
+    TEST_ISSUE_LINKS,
+    TEST_ISSUE_WORK_ITEMS,
+    TEST_PROJECTS,
     TEST_SPRINT,
+    TEST_SPRINTS,
+    TEST_TAGS,
+    TEST_USERS,
+    TEST_WORK_ITEM_TYPES,
     CustomIssue,
 )
 
+RESPONSES_DIR = Path(__file__).parent / "responses"
+
+
+@cache
+def load_response(response_name: str) -> bytes:
+    return (RESPONSES_DIR / f"{response_name}.json").read_bytes()
 
-def mock_response(url: str, response_name: str, method: HTTPMethod = HTTPMethod.GET):
-    def wrapper(func):
-        @wraps(func)
-        @requests_mock.Mocker()
-        def inner(self, m, *args, **kwargs):
-            m.register_uri(
-                method=method,
-                url=url,
-                text=(Path(__file__).parent / "responses" / f"{response_name}.json").read_text(),
-            )
-            return func(self, *args, **kwargs)
 
+def build_response(request: PreparedRequest, content: bytes) -> Response:
+    response = Response()
+    response.url = request.url
+    response.request = request
+    response.status_code = HTTPStatus.OK
+    response.encoding = "utf-8"
+    response._content = content
+    return response
+
+
+def mock_response(url: str, response_name: str, method: HTTPMethod = HTTPMethod.GET):
+    # Build the route and load its content once when the test is decorated, not on every test run
+    route = (method, url)
+    content = load_response(response_name)
+
+    def decorate(func):
+        def inner(self, *args, **kwargs):
+            self.routes[route] = content
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                del self.routes[route]
+
+        # Test discovery uses the class attribute name, only keep the names for readable reports and tracebacks
+        inner.__name__ = func.__name__
+        inner.__qualname__ = func.__qualname__
         return inner
 
-    return wrapper
+    return decorate
+
+
+class RoutedAdapter(BaseAdapter):
+    """Transport adapter answering requests with cached response contents looked up by method and URL."""
+
+    def __init__(self, routes: dict[tuple[str, str], bytes]):
+        super().__init__()
+        self.routes = routes
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        try:
+            content = self.routes[(request.method, request.url.split("?")[0])]
+        except KeyError:
+            raise ConnectionError(f"No response routed for {request.method} {request.url}", request=request) from None
+        # `Session.send` mutates the response, so every request gets a fresh one
+        return build_response(request, content)
+
+    def close(self):
+        pass
 
 
 class TestClient(TestCase):
-    def setUp(self):
-        self.client = Client(base_url="https://server", token="test")
-
-    @patch.object(youtrack_sdk.client.Session, "request", side_effect=ConnectTimeout)
-    def test_client_timeout(self, mock_request):
-        client = Client(base_url="https://server", token="test", timeout=123)
-        with self.assertRaises(ConnectTimeout):
-            client.get_issue(issue_id="1")
-        mock_request.assert_called_once_with(
-            method=HTTPMethod.GET,
-            url=ANY,
-            data=None,
-            files=None,
-            headers=None,
-            timeout=123,
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(base_url="https://server", token="test")
+        # `mock_response` routes the responses for the running test
+        cls.routes = {}
+        cls.client._session.mount("https://server/", RoutedAdapter(cls.routes))
+
+    def test_client_timeout(self):
+        calls = []
+
+        def request(session, **kwargs):
+            calls.append(kwargs)
+            raise ConnectTimeout
+
+        original_request = youtrack_sdk.client.Session.request
+        youtrack_sdk.client.Session.request = request
+        try:
+            client = Client(base_url="https://server", token="test", timeout=123)
+            with self.assertRaises(ConnectTimeout):
+                client.get_issue(issue_id="1")
+        finally:
+            youtrack_sdk.client.Session.request = original_request
+
+        # Only the request arguments are checked here, the URL is covered by the other tests
+        for call in calls:
+            del call["url"]
+
+        self.assertEqual(
+            [
+                {
+                    "method": HTTPMethod.GET,
+                    "data": None,
+                    "files": None,
+                    "headers": None,
+                    "timeout": 123,
+                },
+            ],
+            calls,
         )
 
     def test_get_absolute_url(self):
@@ -104,136 +158,32 @@ class TestClient(TestCase):
     @mock_response(url="https://server/api/issues/1/comments", response_name="issue_comments")
     def test_get_issue_comments(self):
         self.assertEqual(
-            (
-                IssueComment.model_construct(
-                    type="IssueComment",
-                    id="4-296",
-                    text="*Hello*, world!",
-                    text_preview="<strong>Hello</strong>, world!",
-                    created=datetime(2021, 12, 14, 11, 17, 48, tzinfo=UTC),
-                    updated=None,
-                    author=User.model_construct(
-                        type="User",
-                        id="1-3",
-                        ring_id="b0fea1e1-ed18-43f6-a99d-40044fb1dfb0",
-                        login="support",
-                        email="support@example.com",
-                    ),
-                    attachments=[],
-                    deleted=False,
-                ),
-                IssueComment.model_construct(
-                    type="IssueComment",
-                    id="4-443",
-                    text="Sample _comment_",
-                    text_preview="Sample <em>comment</em>",
-                    created=datetime(2021, 12, 15, 12, 51, 40, tzinfo=UTC),
-                    updated=datetime(2021, 12, 15, 13, 8, 20, tzinfo=UTC),
-                    author=User.model_construct(
-                        type="User",
-                        id="1-17",
-                        ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-                        login="max.demo",
-                        email="max@example.com",
-                    ),
-                    attachments=[],
-                    deleted=True,
-                ),
-                IssueComment.model_construct(
-                    type="IssueComment",
-                    id="4-678",
-                    text="Comment with attachments",
-                    text_preview="One attachment",
-                    created=datetime(2021, 12, 21, 16, 41, 33, tzinfo=UTC),
-                    updated=None,
-                    author=User.model_construct(
-                        type="User",
-                        id="1-9",
-                        ring_id="f19c93e1-833b-407b-a4de-7f9a3370aaf3",
-                        login="sam",
-                        email="sam@example.com",
-                    ),
-                    attachments=[
-                        IssueAttachment.model_construct(
-                            id="8-312",
-                            type="IssueAttachment",
-                            created=datetime(2021, 12, 21, 16, 41, 33, tzinfo=UTC),
-                            updated=datetime(2021, 12, 21, 16, 41, 35, tzinfo=UTC),
-                            author=None,
-                            url="/attachments/url",
-                            mime_type="text/plain",
-                            name="test.txt",
-                        ),
-                    ],
-                    deleted=False,
-                ),
-            ),
+            TEST_ISSUE_COMMENTS,
             self.client.get_issue_comments(issue_id="1"),
         )
 
     @mock_response(url="https://server/api/issues/1/timeTracking/workItems", response_name="issue_work_items")
     def test_get_issue_work_items(self):
         self.assertEqual(
-            (
-                IssueWorkItem.model_construct(
-                    type="IssueWorkItem",
-                    id="12-14",
-                    author=User.model_construct(
-                        type="User",
-                        id="1-64",
-                        name="Paul Lawson",
-                        ring_id="d53ece48-4c60-4b88-b93f-68392b975087",
-                        login="paul.lawson",
-                        email="",
-                    ),
-                    creator=User.model_construct(
-                        type="User",
-                        id="1-52",
-                        name="Mary Jane",
-                        ring_id="26677773-c425-4f47-b62c-dbfb2ad21e8f",
-                        login="mary.jane",
-                        email="mary.jane@example.com",
-                    ),
-                    text="Working hard",
-                    text_preview='<div class="wiki text common-markdown"><p>Working hard</p>\n</div>',
-                    work_item_type=WorkItemType(
-                        type="WorkItemType",
-                        id="1-0",
-                        name="Development",
-                    ),
-                    created=datetime(2024, 3, 13, 11, 55, 27, tzinfo=UTC),
-                    updated=None,
-                    duration=DurationValue(
-                        type="DurationValue",
-                        id="100",
-                        minutes=100,
-                        presentation="1h 40m",
-                    ),
-                    date=datetime(2024, 3, 3, 0, 0, tzinfo=UTC),
-                ),
-            ),
+            TEST_ISSUE_WORK_ITEMS,
             self.client.get_issue_work_items(issue_id="1"),
         )
 
     @mock_response(url="https://server/api/admin/projects", response_name="projects")
-    def test_get_projects(self):
-        self.assertEqual(
-            (
-                Project.model_construct(
-                    type="Project",
-                    id="0-0",
-                    name="Demo project",
-                    short_name="DEMO",
-                ),
-                Project.model_construct(
-                    type="Project",
-                    id="0-5",
-                    name="Help Desk",
-                    short_name="HD",
-                ),
-            ),
-            self.client.get_projects(),
-        )
+    @mock_response(url="https://server/api/tags", response_name="tags")
+    @mock_response(url="https://server/api/users", response_name="users")
+    @mock_response(url="https://server/api/issueLinkTypes", response_name="issue_link_types")
+    @mock_response(url="https://server/api/agiles", response_name="agiles")
+    def test_get_entity_lists(self):
+        for get_entities, expected in (
+            (self.client.get_projects, TEST_PROJECTS),
+            (self.client.get_tags, TEST_TAGS),
+            (self.client.get_users, TEST_USERS),
+            (self.client.get_issue_link_types, TEST_ISSUE_LINK_TYPES),
+            (self.client.get_agiles, TEST_AGILES),
+        ):
+            with self.subTest(get_entities.__name__):
+                self.assertEqual(expected, get_entities())
 
     @mock_response(
         url="https://server/api/admin/projects/DEMO/timeTrackingSettings/workItemTypes",
@@ -241,358 +191,14 @@ class TestClient(TestCase):
     )
     def test_get_project_work_item_types(self):
         self.assertEqual(
-            (
-                WorkItemType.model_construct(
-                    type="WorkItemType",
-                    id="1-0",
-                    name="Development",
-                ),
-                WorkItemType.model_construct(
-                    type="WorkItemType",
-                    id="1-1",
-                    name="Testing",
-                ),
-                WorkItemType.model_construct(
-                    type="WorkItemType",
-                    id="1-2",
-                    name="Documentation",
-                ),
-            ),
+            TEST_WORK_ITEM_TYPES,
             self.client.get_project_work_item_types(project_id="DEMO"),
         )
 
-    @mock_response(url="https://server/api/tags", response_name="tags")
-    def test_get_tags(self):
-        self.assertEqual(
-            (
-                Tag.model_construct(
-                    type="Tag",
-                    id="6-0",
-                    name="productivity",
-                ),
-                Tag.model_construct(
-                    type="Tag",
-                    id="6-1",
-                    name="tip",
-                ),
-                Tag.model_construct(
-                    type="Tag",
-                    id="6-5",
-                    name="Star",
-                ),
-            ),
-            self.client.get_tags(),
-        )
-
-    @mock_response(url="https://server/api/users", response_name="users")
-    def test_get_users(self):
-        self.assertEqual(
-            (
-                User.model_construct(
-                    type="User",
-                    id="1-17",
-                    ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-                    login="max.demo",
-                    email="max@example.com",
-                ),
-                User.model_construct(
-                    type="User",
-                    id="1-3",
-                    ring_id="b0fea1e1-ed18-43f6-a99d-40044fb1dfb0",
-                    login="support",
-                    email="support@example.com",
-                ),
-                User.model_construct(
-                    type="User",
-                    id="1-9",
-                    ring_id="f19c93e1-833b-407b-a4de-7f9a3370aaf3",
-                    login="sam",
-                    email="sam@example.com",
-                ),
-                User.model_construct(
-                    type="User",
-                    id="1-10",
-                    ring_id="20e4e701-7e87-45f8-8492-c448600b7991",
-                    name="Worker Buddy",
-                    login="worker",
-                    email="worker@example.com",
-                ),
-            ),
-            self.client.get_users(),
-        )
-
-    @mock_response(url="https://server/api/issueLinkTypes", response_name="issue_link_types")
-    def test_get_issue_link_types(self):
-        self.assertEqual(
-            (
-                IssueLinkType.model_construct(
-                    type="IssueLinkType",
-                    id="106-0",
-                    name="Relates",
-                    localized_name=None,
-                    source_to_target="relates to",
-                    localized_source_to_target=None,
-                    target_to_source="",
-                    localized_target_to_source=None,
-                    directed=False,
-                    aggregation=False,
-                    read_only=False,
-                ),
-                IssueLinkType.model_construct(
-                    type="IssueLinkType",
-                    id="106-1",
-                    name="Depend",
-                    localized_name=None,
-                    source_to_target="is required for",
-                    localized_source_to_target=None,
-                    target_to_source="depends on",
-                    localized_target_to_source=None,
-                    directed=True,
-                    aggregation=False,
-                    read_only=False,
-                ),
-                IssueLinkType.model_construct(
-                    type="IssueLinkType",
-                    id="106-2",
-                    name="Duplicate",
-                    localized_name=None,
-                    source_to_target="is duplicated by",
-                    localized_source_to_target=None,
-                    target_to_source="duplicates",
-                    localized_target_to_source=None,
-                    directed=True,
-                    aggregation=True,
-                    read_only=True,
-                ),
-                IssueLinkType.model_construct(
-                    type="IssueLinkType",
-                    id="106-3",
-                    name="Subtask",
-                    localized_name=None,
-                    source_to_target="parent for",
-                    localized_source_to_target=None,
-                    target_to_source="subtask of",
-                    localized_target_to_source=None,
-                    directed=True,
-                    aggregation=True,
-                    read_only=True,
-                ),
-            ),
-            self.client.get_issue_link_types(),
-        )
-
     @mock_response(url="https://server/api/issues/1/links", response_name="issue_links")
     def test_get_issue_links(self):
         self.assertEqual(
-            (
-                IssueLink.model_construct(
-                    id="106-0",
-                    direction="BOTH",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-0",
-                        name="Relates",
-                        localized_name=None,
-                        source_to_target="relates to",
-                        localized_source_to_target=None,
-                        target_to_source="",
-                        localized_target_to_source=None,
-                        directed=False,
-                        aggregation=False,
-                        read_only=False,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-                IssueLink.model_construct(
-                    id="106-1s",
-                    direction="OUTWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-1",
-                        name="Depend",
-                        localized_name=None,
-                        source_to_target="is required for",
-                        localized_source_to_target=None,
-                        target_to_source="depends on",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=False,
-                        read_only=False,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-                IssueLink.model_construct(
-                    id="106-1t",
-                    direction="INWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-1",
-                        name="Depend",
-                        localized_name=None,
-                        source_to_target="is required for",
-                        localized_source_to_target=None,
-                        target_to_source="depends on",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=False,
-                        read_only=False,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-                IssueLink.model_construct(
-                    id="106-2s",
-                    direction="OUTWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-2",
-                        name="Duplicate",
-                        localized_name=None,
-                        source_to_target="is duplicated by",
-                        localized_source_to_target=None,
-                        target_to_source="duplicates",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=True,
-                        read_only=True,
-                    ),
-                    issues=[
-                        Issue.model_construct(
-                            type="Issue",
-                            id="2-46619",
-                            id_readable="PT-1839",
-                            created=datetime(2022, 9, 26, 13, 50, 12, 810000, tzinfo=UTC),
-                            updated=datetime(2022, 10, 5, 6, 28, 57, 291000, tzinfo=UTC),
-                            resolved=datetime(2022, 9, 26, 13, 51, 29, 671000, tzinfo=UTC),
-                            project=Project.model_construct(
-                                type="Project",
-                                id="0-4",
-                                name="Test: project",
-                                short_name="PT",
-                            ),
-                            reporter=User.model_construct(
-                                type="User",
-                                id="1-52",
-                                name="Mary Jane",
-                                ring_id="26677773-c425-4f47-b62c-dbfb2ad21e8f",
-                                login="mary.jane",
-                                email=None,
-                            ),
-                            updater=User.model_construct(
-                                type="User",
-                                id="1-64",
-                                name="Paul Lawson",
-                                ring_id="d53ece48-4c60-4b88-b93f-68392b975087",
-                                login="paul.lawson",
-                                email="",
-                            ),
-                            summary="Fintra Auftrag: 99 - Last Name, First Name",
-                            description="",
-                            wikified_description="",
-                            comments_count=5,
-                            tags=[],
-                            custom_fields=[],
-                        ),
-                    ],
-                    trimmed_issues=[
-                        Issue.model_construct(
-                            type="Issue",
-                            id="2-46619",
-                            id_readable="PT-1840",
-                            created=datetime(2022, 9, 26, 13, 50, 12, 810000, tzinfo=UTC),
-                            updated=datetime(2022, 10, 5, 6, 28, 57, 291000, tzinfo=UTC),
-                            resolved=datetime(2022, 9, 26, 13, 51, 29, 671000, tzinfo=UTC),
-                            project=Project.model_construct(
-                                type="Project",
-                                id="0-4",
-                                name="Test: project",
-                                short_name="PT",
-                            ),
-                            reporter=User.model_construct(
-                                type="User",
-                                id="1-52",
-                                name="Mary Jane",
-                                ring_id="26677773-c425-4f47-b62c-dbfb2ad21e8f",
-                                login="mary.jane",
-                                email=None,
-                            ),
-                            updater=User.model_construct(
-                                type="User",
-                                id="1-64",
-                                name="Paul Lawson",
-                                ring_id="d53ece48-4c60-4b88-b93f-68392b975087",
-                                login="paul.lawson",
-                                email="",
-                            ),
-                            summary="Fintra Auftrag: 99 - Last Name, First Name",
-                            description="",
-                            wikified_description="",
-                            comments_count=0,
-                            tags=[],
-                            custom_fields=[],
-                        ),
-                    ],
-                ),
-                IssueLink.model_construct(
-                    id="106-2t",
-                    direction="INWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-2",
-                        name="Duplicate",
-                        localized_name=None,
-                        source_to_target="is duplicated by",
-                        localized_source_to_target=None,
-                        target_to_source="duplicates",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=True,
-                        read_only=True,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-                IssueLink.model_construct(
-                    id="106-3s",
-                    direction="OUTWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-3",
-                        name="Subtask",
-                        localized_name=None,
-                        source_to_target="parent for",
-                        localized_source_to_target=None,
-                        target_to_source="subtask of",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=True,
-                        read_only=True,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-                IssueLink.model_construct(
-                    id="106-3t",
-                    direction="INWARD",
-                    link_type=IssueLinkType.model_construct(
-                        type="IssueLinkType",
-                        id="106-3",
-                        name="Subtask",
-                        localized_name=None,
-                        source_to_target="parent for",
-                        localized_source_to_target=None,
-                        target_to_source="subtask of",
-                        localized_target_to_source=None,
-                        directed=True,
-                        aggregation=True,
-                        read_only=True,
-                    ),
-                    issues=[],
-                    trimmed_issues=[],
-                ),
-            ),
+            TEST_ISSUE_LINKS,
             self.client.get_issue_links(issue_id="1"),
         )
 
@@ -603,49 +209,6 @@ class TestClient(TestCase):
             self.client.update_issue(issue_id="1", issue=TEST_ISSUE),
         )
 
-    @mock_response(url="https://server/api/agiles", response_name="agiles", method=HTTPMethod.GET)
-    def test_get_agiles(self):
-        self.assertEqual(
-            (
-                Agile.model_construct(
-                    type="Agile",
-                    id="120-0",
-                    name="Demo Board",
-                    owner=User.model_construct(
-                        type="User",
-                        id="1-17",
-                        name="Max Demo",
-                        ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-                        login="max.demo",
-                        email="max@example.com",
-                    ),
-                    visible_for=None,
-                    projects=[
-                        Project.model_construct(
-                            type="Project",
-                            id="0-0",
-                            name="Demo project",
-                            short_name="DEMO",
-                        ),
-                    ],
-                    sprints=[
-                        SprintRef.model_construct(
-                            type="Sprint",
-                            id="121-12",
-                            name="First sprint",
-                        ),
-                    ],
-                    current_sprint=SprintRef.model_construct(
-                        type="Sprint",
-                        id="121-12",
-                        name="First sprint",
-                    ),
-                ),
-                TEST_AGILE,
-            ),
-            self.client.get_agiles(),
-        )
-
     @mock_response(url="https://server/api/agiles/120-8", response_name="agile", method=HTTPMethod.GET)
     def test_get_agile(self):
         self.assertEqual(
@@ -656,27 +219,7 @@ class TestClient(TestCase):
     @mock_response(url="https://server/api/agiles/120-8/sprints", response_name="sprints", method=HTTPMethod.GET)
     def test_get_sprints(self):
         self.assertEqual(
-            (
-                TEST_SPRINT,
-                Sprint.model_construct(
-                    type="Sprint",
-                    id="121-11",
-                    name="Week 2",
-                    goal="Finish everything",
-                    start=datetime(2023, 2, 5, 0, 0, tzinfo=UTC),
-                    finish=datetime(2023, 2, 18, 23, 59, 59, 999000, tzinfo=UTC),
-                    archived=False,
-                    is_default=False,
-                    unresolved_issues_count=0,
-                    agile=AgileRef.model_construct(
-                        type="Agile",
-                        id="120-8",
-                        name="Kanban",
-                    ),
-                    issues=[TEST_ISSUE],
-                    previous_sprint=None,
-                ),
-            ),
+            TEST_SPRINTS,
             self.client.get_sprints(agile_id="120-8"),
         )
 
@@ -1,5 +1,5 @@
 import json
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta, timezone
 from typing import Literal, Optional, Sequence
 from unittest import TestCase
 
@@ -182,3 +182,33 @@ class TestDatesToTimestamp(TestCase):
                 ),
             ),
         )
+
+    def test_timezones(self):
+        plus_two_hours = timezone(timedelta(hours=2))
+        self.assertDictEqual(
+            {
+                "utc_value": 1664200212810,
+                "offset_value": 1664200212810,
+                "rounding_utc_value": 537031957652,
+                "rounding_offset_value": 537031957652,
+                "pre_epoch_value": -1,
+            },
+            json.loads(
+                custom_json_dumps(
+                    {
+                        "utc_value": datetime(2022, 9, 26, 13, 50, 12, 810000, tzinfo=UTC),
+                        "offset_value": datetime(2022, 9, 26, 15, 50, 12, 810000, tzinfo=plus_two_hours),
+                        # `int(timestamp() * 1000)` loses a millisecond to float rounding for this instant
+                        "rounding_utc_value": datetime(1987, 1, 7, 15, 32, 37, 652000, tzinfo=UTC),
+                        "rounding_offset_value": datetime(1987, 1, 7, 17, 32, 37, 652000, tzinfo=plus_two_hours),
+                        "pre_epoch_value": datetime(1969, 12, 31, 23, 59, 59, 999500, tzinfo=UTC),
+                    },
+                ),
+            ),
+        )
+
+    def test_compact_output(self):
+        self.assertEqual(
+            '{"date_value":1645099200000,"list_value":[1,2]}',
+            custom_json_dumps({"date_value": date(2022, 2, 17), "list_value": [1, 2]}),
+        )
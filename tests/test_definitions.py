@@ -9,11 +9,17 @@ from youtrack_sdk.entities import (
     BaseModel,
     CustomField,
     DateIssueCustomField,
+    DurationValue,
     EnumBundleElement,
     EnumProjectCustomField,
     FieldType,
     Issue,
+    IssueAttachment,
+    IssueComment,
     IssueCustomFieldType,
+    IssueLink,
+    IssueLinkType,
+    IssueWorkItem,
     Project,
     SimpleIssueCustomField,
     SimpleProjectCustomField,
@@ -28,6 +34,7 @@ from youtrack_sdk.entities import (
     User,
     UserGroup,
     UserProjectCustomField,
+    WorkItemType,
 )
 
 
@@ -41,6 +48,167 @@ class CustomIssue(BaseModel):
     custom_fields: Optional[Sequence[IssueCustomFieldType]] = Field(alias="customFields", default=None)
 
 
+# Parsed sequence fields are lists and a tuple would not compare equal to them,
+# so all expected empty sequences share a single list instead of allocating new ones
+EMPTY_LIST: list = []
+
+TEST_ISSUE_CREATED = datetime(2021, 2, 9, 14, 3, 11, tzinfo=UTC)
+TEST_ISSUE_UPDATED = datetime(2021, 8, 22, 10, 28, 16, tzinfo=UTC)
+TEST_ISSUE_2_CREATED = datetime(2022, 10, 26, 9, 44, 44, tzinfo=UTC)
+TEST_ISSUE_2_UPDATED = datetime(2022, 10, 27, 16, 46, 11, tzinfo=UTC)
+TEST_ISSUE_2_RESOLVED = datetime(2022, 10, 30, 18, 1, 55, tzinfo=UTC)
+TEST_LINKED_ISSUE_CREATED = datetime(2022, 9, 26, 13, 50, 12, 810000, tzinfo=UTC)
+TEST_LINKED_ISSUE_UPDATED = datetime(2022, 10, 5, 6, 28, 57, 291000, tzinfo=UTC)
+TEST_LINKED_ISSUE_RESOLVED = datetime(2022, 9, 26, 13, 51, 29, 671000, tzinfo=UTC)
+TEST_ATTACHMENT_CREATED = datetime(2021, 12, 21, 16, 41, 33, tzinfo=UTC)
+
+TEST_USER_SUPPORT = User.model_construct(
+    type="User",
+    id="1-3",
+    ring_id="b0fea1e1-ed18-43f6-a99d-40044fb1dfb0",
+    login="support",
+    email="support@example.com",
+)
+
+TEST_USER_MAX_DEMO = User.model_construct(
+    type="User",
+    id="1-17",
+    ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
+    login="max.demo",
+    email="max@example.com",
+)
+
+TEST_USER_SAM = User.model_construct(
+    type="User",
+    id="1-9",
+    ring_id="f19c93e1-833b-407b-a4de-7f9a3370aaf3",
+    login="sam",
+    email="sam@example.com",
+)
+
+TEST_USER_WORKER = User.model_construct(
+    type="User",
+    id="1-10",
+    ring_id="20e4e701-7e87-45f8-8492-c448600b7991",
+    name="Worker Buddy",
+    login="worker",
+    email="worker@example.com",
+)
+
+TEST_USER_MARY_JANE = User.model_construct(
+    type="User",
+    id="1-52",
+    name="Mary Jane",
+    ring_id="26677773-c425-4f47-b62c-dbfb2ad21e8f",
+    login="mary.jane",
+    email=None,
+)
+
+TEST_USER_PAUL_LAWSON = User.model_construct(
+    type="User",
+    id="1-64",
+    name="Paul Lawson",
+    ring_id="d53ece48-4c60-4b88-b93f-68392b975087",
+    login="paul.lawson",
+    email="",
+)
+
+TEST_AGILE_OWNER = User.model_construct(
+    type="User",
+    id="1-17",
+    name="Max Demo",
+    ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
+    login="max.demo",
+    email="max@example.com",
+)
+
+TEST_HELP_DESK_PROJECT = Project.model_construct(
+    type="Project",
+    id="0-1",
+    name="Help Desk",
+    short_name="HD",
+)
+
+TEST_STATE_PROJECT_CUSTOM_FIELD = StateProjectCustomField.model_construct(
+    type="StateProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="state[1]"),
+    ),
+)
+
+TEST_USER_PROJECT_CUSTOM_FIELD = UserProjectCustomField.model_construct(
+    type="UserProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="user[1]"),
+    ),
+)
+
+TEST_ENUM_PROJECT_CUSTOM_FIELD = EnumProjectCustomField.model_construct(
+    type="EnumProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="enum[1]"),
+    ),
+)
+
+TEST_DATE_PROJECT_CUSTOM_FIELD = SimpleProjectCustomField.model_construct(
+    type="SimpleProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="date"),
+    ),
+)
+
+TEST_DATE_TIME_PROJECT_CUSTOM_FIELD = SimpleProjectCustomField.model_construct(
+    type="SimpleProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="date and time"),
+    ),
+)
+
+TEST_STRING_PROJECT_CUSTOM_FIELD = SimpleProjectCustomField.model_construct(
+    type="SimpleProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="string"),
+    ),
+)
+
+TEST_INTEGER_PROJECT_CUSTOM_FIELD = SimpleProjectCustomField.model_construct(
+    type="SimpleProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="integer"),
+    ),
+)
+
+TEST_FLOAT_PROJECT_CUSTOM_FIELD = SimpleProjectCustomField.model_construct(
+    type="SimpleProjectCustomField",
+    field=CustomField.model_construct(
+        type="CustomField",
+        field_type=FieldType.model_construct(type="FieldType", id="float"),
+    ),
+)
+
+
+def build_simple_custom_field(
+    field_id: str,
+    name: str,
+    value: object,
+    project_custom_field: SimpleProjectCustomField,
+) -> SimpleIssueCustomField:
+    return SimpleIssueCustomField.model_construct(
+        id=field_id,
+        name=name,
+        type="SimpleIssueCustomField",
+        value=value,
+        project_custom_field=project_custom_field,
+    )
+
+
 TEST_STATE_CUSTOM_FIELD = StateIssueCustomField.model_construct(
     id="110-50",
     name="State",
@@ -50,45 +218,55 @@ TEST_STATE_CUSTOM_FIELD = StateIssueCustomField.model_construct(
         name="In Progress",
         type="StateBundleElement",
     ),
-    project_custom_field=StateProjectCustomField.model_construct(
-        field=CustomField.model_construct(
-            type="CustomField",
-            field_type=FieldType.model_construct(
-                type="FieldType",
-                id="state[1]",
-            ),
-        ),
-        type="StateProjectCustomField",
+    project_custom_field=TEST_STATE_PROJECT_CUSTOM_FIELD,
+)
+
+TEST_TYPE_CUSTOM_FIELD = SingleEnumIssueCustomField.model_construct(
+    id="110-49",
+    name="Type",
+    type="SingleEnumIssueCustomField",
+    value=EnumBundleElement.model_construct(
+        id="96-38",
+        name="Value One",
+        type="EnumBundleElement",
+    ),
+    project_custom_field=TEST_ENUM_PROJECT_CUSTOM_FIELD,
+)
+
+TEST_STATE_CUSTOM_FIELD_2 = StateIssueCustomField.model_construct(
+    id="110-50",
+    name="State",
+    type="StateIssueCustomField",
+    value=StateBundleElement.model_construct(
+        id="98-22",
+        name="Fixed",
+        type="StateBundleElement",
+    ),
+    project_custom_field=TEST_STATE_PROJECT_CUSTOM_FIELD,
+)
+
+TEST_TYPE_CUSTOM_FIELD_2 = SingleEnumIssueCustomField.model_construct(
+    id="110-49",
+    name="Type",
+    type="SingleEnumIssueCustomField",
+    value=EnumBundleElement.model_construct(
+        id="96-95",
+        name="Other",
+        type="EnumBundleElement",
     ),
+    project_custom_field=TEST_ENUM_PROJECT_CUSTOM_FIELD,
 )
 
 TEST_ISSUE = Issue.model_construct(
     type="Issue",
     id="1-937",
     id_readable="HD-25",
-    created=datetime(2021, 2, 9, 14, 3, 11, tzinfo=UTC),
-    updated=datetime(2021, 8, 22, 10, 28, 16, tzinfo=UTC),
+    created=TEST_ISSUE_CREATED,
+    updated=TEST_ISSUE_UPDATED,
     resolved=None,
-    project=Project.model_construct(
-        type="Project",
-        id="0-1",
-        name="Help Desk",
-        short_name="HD",
-    ),
-    reporter=User.model_construct(
-        type="User",
-        id="1-3",
-        ring_id="b0fea1e1-ed18-43f6-a99d-40044fb1dfb0",
-        login="support",
-        email="support@example.com",
-    ),
-    updater=User.model_construct(
-        type="User",
-        id="1-17",
-        ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-        login="max.demo",
-        email="max@example.com",
-    ),
+    project=TEST_HELP_DESK_PROJECT,
+    reporter=TEST_USER_SUPPORT,
+    updater=TEST_USER_MAX_DEMO,
     summary="Summary text",
     description="Issue description",
     wikified_description="Wikified issue description",
@@ -100,119 +278,27 @@ TEST_ISSUE = Issue.model_construct(
             id="111-8",
             name="Assignee",
             type="SingleUserIssueCustomField",
-            value=User.model_construct(
-                type="User",
-                id="1-10",
-                ring_id="20e4e701-7e87-45f8-8492-c448600b7991",
-                name="Worker Buddy",
-                login="worker",
-                email="worker@example.com",
-            ),
-            project_custom_field=UserProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="user[1]"),
-                ),
-                type="UserProjectCustomField",
-            ),
-        ),
-        SingleEnumIssueCustomField.model_construct(
-            id="110-49",
-            name="Type",
-            type="SingleEnumIssueCustomField",
-            value=EnumBundleElement.model_construct(
-                id="96-38",
-                name="Value One",
-                type="EnumBundleElement",
-            ),
-            project_custom_field=EnumProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="enum[1]"),
-                ),
-                type="EnumProjectCustomField",
-            ),
+            value=TEST_USER_WORKER,
+            project_custom_field=TEST_USER_PROJECT_CUSTOM_FIELD,
         ),
+        TEST_TYPE_CUSTOM_FIELD,
         DateIssueCustomField.model_construct(
             id="145-34",
             name="Due Date",
             type="DateIssueCustomField",
             value=date(2023, 7, 4),
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="date"),
-                ),
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-35",
-            name="Started at",
-            type="SimpleIssueCustomField",
-            value=datetime(2021, 6, 11, 7, 32, 9, tzinfo=UTC),
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(
-                        type="FieldType",
-                        id="date and time",
-                    ),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-36",
-            name="Multipass",
-            type="SimpleIssueCustomField",
-            value="1623396729",
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="string"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
+            project_custom_field=TEST_DATE_PROJECT_CUSTOM_FIELD,
         ),
-        SimpleIssueCustomField.model_construct(
-            id="145-39",
-            name="Price",
-            type="SimpleIssueCustomField",
-            value=4003,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="integer"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-37",
-            name="Multiplier",
-            type="SimpleIssueCustomField",
-            value=3.1412,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="float"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-38",
-            name="Extra",
-            type="SimpleIssueCustomField",
-            value=None,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="string"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
+        build_simple_custom_field(
+            "145-35",
+            "Started at",
+            datetime(2021, 6, 11, 7, 32, 9, tzinfo=UTC),
+            TEST_DATE_TIME_PROJECT_CUSTOM_FIELD,
         ),
+        build_simple_custom_field("145-36", "Multipass", "1623396729", TEST_STRING_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-39", "Price", 4003, TEST_INTEGER_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-37", "Multiplier", 3.1412, TEST_FLOAT_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-38", "Extra", None, TEST_STRING_PROJECT_CUSTOM_FIELD),
     ],
 )
 
@@ -220,15 +306,10 @@ TEST_ISSUE_2 = Issue.model_construct(
     type="Issue",
     id="2-48",
     id_readable="HD-17",
-    created=datetime(2022, 10, 26, 9, 44, 44, tzinfo=UTC),
-    updated=datetime(2022, 10, 27, 16, 46, 11, tzinfo=UTC),
-    resolved=datetime(2022, 10, 30, 18, 1, 55, tzinfo=UTC),
-    project=Project.model_construct(
-        type="Project",
-        id="0-1",
-        name="Help Desk",
-        short_name="HD",
-    ),
+    created=TEST_ISSUE_2_CREATED,
+    updated=TEST_ISSUE_2_UPDATED,
+    resolved=TEST_ISSUE_2_RESOLVED,
+    project=TEST_HELP_DESK_PROJECT,
     reporter=User.model_construct(
         type="User",
         id="1-1",
@@ -236,245 +317,65 @@ TEST_ISSUE_2 = Issue.model_construct(
         login="alex",
         email="alex@example.com",
     ),
-    updater=User.model_construct(
-        type="User",
-        id="1-17",
-        ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-        login="max.demo",
-        email="max@example.com",
-    ),
+    updater=TEST_USER_MAX_DEMO,
     summary="Title",
     description="Some text",
     wikified_description="Wikified some text",
     comments_count=0,
-    tags=[],
+    tags=EMPTY_LIST,
     custom_fields=[
-        StateIssueCustomField.model_construct(
-            id="110-50",
-            name="State",
-            type="StateIssueCustomField",
-            value=StateBundleElement.model_construct(
-                id="98-22",
-                name="Fixed",
-                type="StateBundleElement",
-            ),
-            project_custom_field=StateProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(
-                        type="FieldType",
-                        id="state[1]",
-                    ),
-                ),
-                type="StateProjectCustomField",
-            ),
-        ),
+        TEST_STATE_CUSTOM_FIELD_2,
         SingleUserIssueCustomField.model_construct(
             id="111-8",
             name="Assignee",
             type="SingleUserIssueCustomField",
             value=None,
-            project_custom_field=UserProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="user[1]"),
-                ),
-                type="UserProjectCustomField",
-            ),
-        ),
-        SingleEnumIssueCustomField.model_construct(
-            id="110-49",
-            name="Type",
-            type="SingleEnumIssueCustomField",
-            value=EnumBundleElement.model_construct(
-                id="96-95",
-                name="Other",
-                type="EnumBundleElement",
-            ),
-            project_custom_field=EnumProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="enum[1]"),
-                ),
-                type="EnumProjectCustomField",
-            ),
+            project_custom_field=TEST_USER_PROJECT_CUSTOM_FIELD,
         ),
+        TEST_TYPE_CUSTOM_FIELD_2,
         DateIssueCustomField.model_construct(
             id="145-34",
             name="Due Date",
             type="DateIssueCustomField",
             value=None,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="date"),
-                ),
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-35",
-            name="Started at",
-            type="SimpleIssueCustomField",
-            value=datetime(2022, 10, 26, 19, 21, 4, tzinfo=UTC),
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(
-                        type="FieldType",
-                        id="date and time",
-                    ),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-36",
-            name="Multipass",
-            type="SimpleIssueCustomField",
-            value="2000000000000",
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="string"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-39",
-            name="Price",
-            type="SimpleIssueCustomField",
-            value=-128,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="integer"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
+            project_custom_field=TEST_DATE_PROJECT_CUSTOM_FIELD,
         ),
-        SimpleIssueCustomField.model_construct(
-            id="145-37",
-            name="Multiplier",
-            type="SimpleIssueCustomField",
-            value=-2.4,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="float"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
-        ),
-        SimpleIssueCustomField.model_construct(
-            id="145-38",
-            name="Extra",
-            type="SimpleIssueCustomField",
-            value=None,
-            project_custom_field=SimpleProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="string"),
-                ),
-                type="SimpleProjectCustomField",
-            ),
+        build_simple_custom_field(
+            "145-35",
+            "Started at",
+            datetime(2022, 10, 26, 19, 21, 4, tzinfo=UTC),
+            TEST_DATE_TIME_PROJECT_CUSTOM_FIELD,
         ),
+        build_simple_custom_field("145-36", "Multipass", "2000000000000", TEST_STRING_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-39", "Price", -128, TEST_INTEGER_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-37", "Multiplier", -2.4, TEST_FLOAT_PROJECT_CUSTOM_FIELD),
+        build_simple_custom_field("145-38", "Extra", None, TEST_STRING_PROJECT_CUSTOM_FIELD),
     ],
 )
 
 TEST_CUSTOM_ISSUE = CustomIssue.model_construct(
     type="Issue",
     id_readable="HD-25",
-    created=datetime(2021, 2, 9, 14, 3, 11, tzinfo=UTC),
-    updated=datetime(2021, 8, 22, 10, 28, 16, tzinfo=UTC),
+    created=TEST_ISSUE_CREATED,
+    updated=TEST_ISSUE_UPDATED,
     resolved=None,
     comments_count=7,
     custom_fields=[
-        StateIssueCustomField.model_construct(
-            id="110-50",
-            name="State",
-            type="StateIssueCustomField",
-            value=StateBundleElement.model_construct(
-                id="98-37",
-                name="In Progress",
-                type="StateBundleElement",
-            ),
-            project_custom_field=StateProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(
-                        type="FieldType",
-                        id="state[1]",
-                    ),
-                ),
-                type="StateProjectCustomField",
-            ),
-        ),
-        SingleEnumIssueCustomField.model_construct(
-            id="110-49",
-            name="Type",
-            type="SingleEnumIssueCustomField",
-            value=EnumBundleElement.model_construct(
-                id="96-38",
-                name="Value One",
-                type="EnumBundleElement",
-            ),
-            project_custom_field=EnumProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="enum[1]"),
-                ),
-                type="EnumProjectCustomField",
-            ),
-        ),
+        TEST_STATE_CUSTOM_FIELD,
+        TEST_TYPE_CUSTOM_FIELD,
     ],
 )
 
 TEST_CUSTOM_ISSUE_2 = CustomIssue.model_construct(
     type="Issue",
     id_readable="HD-17",
-    created=datetime(2022, 10, 26, 9, 44, 44, tzinfo=UTC),
-    updated=datetime(2022, 10, 27, 16, 46, 11, tzinfo=UTC),
-    resolved=datetime(2022, 10, 30, 18, 1, 55, tzinfo=UTC),
+    created=TEST_ISSUE_2_CREATED,
+    updated=TEST_ISSUE_2_UPDATED,
+    resolved=TEST_ISSUE_2_RESOLVED,
     comments_count=0,
     custom_fields=[
-        StateIssueCustomField.model_construct(
-            id="110-50",
-            name="State",
-            type="StateIssueCustomField",
-            value=StateBundleElement.model_construct(
-                id="98-22",
-                name="Fixed",
-                type="StateBundleElement",
-            ),
-            project_custom_field=StateProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(
-                        type="FieldType",
-                        id="state[1]",
-                    ),
-                ),
-                type="StateProjectCustomField",
-            ),
-        ),
-        SingleEnumIssueCustomField.model_construct(
-            id="110-49",
-            name="Type",
-            type="SingleEnumIssueCustomField",
-            value=EnumBundleElement.model_construct(
-                id="96-95",
-                name="Other",
-                type="EnumBundleElement",
-            ),
-            project_custom_field=EnumProjectCustomField.model_construct(
-                field=CustomField.model_construct(
-                    type="CustomField",
-                    field_type=FieldType.model_construct(type="FieldType", id="enum[1]"),
-                ),
-                type="EnumProjectCustomField",
-            ),
-        ),
+        TEST_STATE_CUSTOM_FIELD_2,
+        TEST_TYPE_CUSTOM_FIELD_2,
     ],
 )
 
@@ -482,14 +383,7 @@ TEST_AGILE = Agile.model_construct(
     type="Agile",
     id="120-8",
     name="Kanban",
-    owner=User.model_construct(
-        type="User",
-        id="1-17",
-        name="Max Demo",
-        ring_id="c5d08431-dd52-4cdd-9911-7ec3a18ad117",
-        login="max.demo",
-        email="max@example.com",
-    ),
+    owner=TEST_AGILE_OWNER,
     visible_for=UserGroup.model_construct(
         type="UserGroup",
         id="3-20",
@@ -538,6 +432,273 @@ TEST_SPRINT = Sprint.model_construct(
         id="120-8",
         name="Kanban",
     ),
-    issues=[],
+    issues=EMPTY_LIST,
     previous_sprint=None,
 )
+
+TEST_ISSUE_LINK_TYPES = tuple(
+    IssueLinkType.model_construct(
+        type="IssueLinkType",
+        id=link_type_id,
+        name=name,
+        localized_name=None,
+        source_to_target=source_to_target,
+        localized_source_to_target=None,
+        target_to_source=target_to_source,
+        localized_target_to_source=None,
+        directed=directed,
+        aggregation=aggregation,
+        read_only=read_only,
+    )
+    for link_type_id, name, source_to_target, target_to_source, directed, aggregation, read_only in (
+        ("106-0", "Relates", "relates to", "", False, False, False),
+        ("106-1", "Depend", "is required for", "depends on", True, False, False),
+        ("106-2", "Duplicate", "is duplicated by", "duplicates", True, True, True),
+        ("106-3", "Subtask", "parent for", "subtask of", True, True, True),
+    )
+)
+
+TEST_LINK_TYPE_RELATES, TEST_LINK_TYPE_DEPEND, TEST_LINK_TYPE_DUPLICATE, TEST_LINK_TYPE_SUBTASK = TEST_ISSUE_LINK_TYPES
+
+TEST_LINKED_ISSUE = Issue.model_construct(
+    type="Issue",
+    id="2-46619",
+    id_readable="PT-1839",
+    created=TEST_LINKED_ISSUE_CREATED,
+    updated=TEST_LINKED_ISSUE_UPDATED,
+    resolved=TEST_LINKED_ISSUE_RESOLVED,
+    project=Project.model_construct(
+        type="Project",
+        id="0-4",
+        name="Test: project",
+        short_name="PT",
+    ),
+    reporter=TEST_USER_MARY_JANE,
+    updater=TEST_USER_PAUL_LAWSON,
+    summary="Fintra Auftrag: 99 - Last Name, First Name",
+    description="",
+    wikified_description="",
+    comments_count=5,
+    tags=EMPTY_LIST,
+    custom_fields=EMPTY_LIST,
+)
+
+# The trimmed variant differs from the linked issue only in these fields and shares all nested objects with it
+TEST_TRIMMED_LINKED_ISSUE = TEST_LINKED_ISSUE.model_copy(update={"id_readable": "PT-1840", "comments_count": 0})
+
+TEST_ISSUE_COMMENTS = (
+    IssueComment.model_construct(
+        type="IssueComment",
+        id="4-296",
+        text="*Hello*, world!",
+        text_preview="<strong>Hello</strong>, world!",
+        created=datetime(2021, 12, 14, 11, 17, 48, tzinfo=UTC),
+        updated=None,
+        author=TEST_USER_SUPPORT,
+        attachments=EMPTY_LIST,
+        deleted=False,
+    ),
+    IssueComment.model_construct(
+        type="IssueComment",
+        id="4-443",
+        text="Sample _comment_",
+        text_preview="Sample <em>comment</em>",
+        created=datetime(2021, 12, 15, 12, 51, 40, tzinfo=UTC),
+        updated=datetime(2021, 12, 15, 13, 8, 20, tzinfo=UTC),
+        author=TEST_USER_MAX_DEMO,
+        attachments=EMPTY_LIST,
+        deleted=True,
+    ),
+    IssueComment.model_construct(
+        type="IssueComment",
+        id="4-678",
+        text="Comment with attachments",
+        text_preview="One attachment",
+        created=TEST_ATTACHMENT_CREATED,
+        updated=None,
+        author=TEST_USER_SAM,
+        attachments=[
+            IssueAttachment.model_construct(
+                id="8-312",
+                type="IssueAttachment",
+                created=TEST_ATTACHMENT_CREATED,
+                updated=datetime(2021, 12, 21, 16, 41, 35, tzinfo=UTC),
+                author=None,
+                url="/attachments/url",
+                mime_type="text/plain",
+                name="test.txt",
+            ),
+        ],
+        deleted=False,
+    ),
+)
+
+TEST_ISSUE_WORK_ITEMS = (
+    IssueWorkItem.model_construct(
+        type="IssueWorkItem",
+        id="12-14",
+        author=TEST_USER_PAUL_LAWSON,
+        creator=User.model_construct(
+            type="User",
+            id="1-52",
+            name="Mary Jane",
+            ring_id="26677773-c425-4f47-b62c-dbfb2ad21e8f",
+            login="mary.jane",
+            email="mary.jane@example.com",
+        ),
+        text="Working hard",
+        text_preview='<div class="wiki text common-markdown"><p>Working hard</p>\n</div>',
+        work_item_type=WorkItemType(
+            type="WorkItemType",
+            id="1-0",
+            name="Development",
+        ),
+        created=datetime(2024, 3, 13, 11, 55, 27, tzinfo=UTC),
+        updated=None,
+        duration=DurationValue(
+            type="DurationValue",
+            id="100",
+            minutes=100,
+            presentation="1h 40m",
+        ),
+        date=datetime(2024, 3, 3, 0, 0, tzinfo=UTC),
+    ),
+)
+
+TEST_ISSUE_LINKS = (
+    IssueLink.model_construct(
+        id="106-0",
+        direction="BOTH",
+        link_type=TEST_LINK_TYPE_RELATES,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+    IssueLink.model_construct(
+        id="106-1s",
+        direction="OUTWARD",
+        link_type=TEST_LINK_TYPE_DEPEND,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+    IssueLink.model_construct(
+        id="106-1t",
+        direction="INWARD",
+        link_type=TEST_LINK_TYPE_DEPEND,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+    IssueLink.model_construct(
+        id="106-2s",
+        direction="OUTWARD",
+        link_type=TEST_LINK_TYPE_DUPLICATE,
+        issues=[TEST_LINKED_ISSUE],
+        trimmed_issues=[TEST_TRIMMED_LINKED_ISSUE],
+    ),
+    IssueLink.model_construct(
+        id="106-2t",
+        direction="INWARD",
+        link_type=TEST_LINK_TYPE_DUPLICATE,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+    IssueLink.model_construct(
+        id="106-3s",
+        direction="OUTWARD",
+        link_type=TEST_LINK_TYPE_SUBTASK,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+    IssueLink.model_construct(
+        id="106-3t",
+        direction="INWARD",
+        link_type=TEST_LINK_TYPE_SUBTASK,
+        issues=EMPTY_LIST,
+        trimmed_issues=EMPTY_LIST,
+    ),
+)
+
+TEST_AGILES = (
+    Agile.model_construct(
+        type="Agile",
+        id="120-0",
+        name="Demo Board",
+        owner=TEST_AGILE_OWNER,
+        visible_for=None,
+        projects=[
+            Project.model_construct(
+                type="Project",
+                id="0-0",
+                name="Demo project",
+                short_name="DEMO",
+            ),
+        ],
+        sprints=[
+            SprintRef.model_construct(
+                type="Sprint",
+                id="121-12",
+                name="First sprint",
+            ),
+        ],
+        current_sprint=SprintRef.model_construct(
+            type="Sprint",
+            id="121-12",
+            name="First sprint",
+        ),
+    ),
+    TEST_AGILE,
+)
+
+TEST_SPRINTS = (
+    TEST_SPRINT,
+    Sprint.model_construct(
+        type="Sprint",
+        id="121-11",
+        name="Week 2",
+        goal="Finish everything",
+        start=datetime(2023, 2, 5, 0, 0, tzinfo=UTC),
+        finish=datetime(2023, 2, 18, 23, 59, 59, 999000, tzinfo=UTC),
+        archived=False,
+        is_default=False,
+        unresolved_issues_count=0,
+        agile=AgileRef.model_construct(
+            type="Agile",
+            id="120-8",
+            name="Kanban",
+        ),
+        issues=[TEST_ISSUE],
+        previous_sprint=None,
+    ),
+)
+
+TEST_PROJECTS = tuple(
+    Project.model_construct(type="Project", id=project_id, name=name, short_name=short_name)
+    for project_id, name, short_name in (
+        ("0-0", "Demo project", "DEMO"),
+        ("0-5", "Help Desk", "HD"),
+    )
+)
+
+TEST_TAGS = tuple(
+    Tag.model_construct(type="Tag", id=tag_id, name=name)
+    for tag_id, name in (
+        ("6-0", "productivity"),
+        ("6-1", "tip"),
+        ("6-5", "Star"),
+    )
+)
+
+TEST_USERS = (
+    TEST_USER_MAX_DEMO,
+    TEST_USER_SUPPORT,
+    TEST_USER_SAM,
+    TEST_USER_WORKER,
+)
+
+TEST_WORK_ITEM_TYPES = tuple(
+    WorkItemType.model_construct(type="WorkItemType", id=work_item_type_id, name=name)
+    for work_item_type_id, name in (
+        ("1-0", "Development"),
+        ("1-1", "Testing"),
+        ("1-2", "Documentation"),
+    )
+)
@@ -8,7 +8,14 @@ from pydantic import Field
 from tests.test_definitions import TEST_ISSUE, TEST_STATE_CUSTOM_FIELD
 from youtrack_sdk import Client
 from youtrack_sdk.entities import BaseModel
-from youtrack_sdk.helpers import NonSingleValueError, exists, get_issue_custom_field, model_to_field_names
+from youtrack_sdk.helpers import (
+    NonSingleValueError,
+    deep_update,
+    exists,
+    get_issue_custom_field,
+    get_type_adapter,
+    model_to_field_names,
+)
 
 
 class SimpleModel(BaseModel):
@@ -28,6 +35,25 @@ class NestedUnionModel(BaseModel):
     entry: Optional[NestedModel | SimpleModel | int] = None
 
 
+class TestDeepUpdate(TestCase):
+    def test_deep_update(self):
+        dest = {"a": 1, "nested": {"b": 2}, "items": [{"c": 3}]}
+        first = {"nested": {"d": 4}, "items": [{"e": 5}]}
+        second = {"nested": {"b": 6}, "f": None}
+        self.assertEqual(
+            {"a": 1, "nested": {"b": 6, "d": 4}, "items": [{"c": 3, "e": 5}], "f": None},
+            deep_update(dest, first, second),
+        )
+        # Neither the destination nor the sources are modified
+        self.assertEqual({"a": 1, "nested": {"b": 2}, "items": [{"c": 3}]}, dest)
+        self.assertEqual({"nested": {"d": 4}, "items": [{"e": 5}]}, first)
+        self.assertEqual({"nested": {"b": 6}, "f": None}, second)
+
+    def test_deep_update_type_mismatch(self):
+        self.assertRaises(TypeError, deep_update, {"a": 1}, {"a": "1"})
+        self.assertRaises(TypeError, deep_update, {"a": [{}]}, {"a": [{}, {}]})
+
+
 class TestModelToFieldNames(TestCase):
     def test_simple_model(self):
         self.assertEqual(
@@ -65,8 +91,12 @@ class TestModelToFieldNames(TestCase):
 
 
 class TestHelpers(TestCase):
-    def setUp(self):
-        self.client = Client(base_url="https://server", token="test")
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(base_url="https://server", token="test")
+        # Tests register their own responses, a later registration takes precedence
+        cls.adapter = requests_mock.Adapter()
+        cls.client._session.mount("https://server/", cls.adapter)
 
     def test_get_issue_custom_field(self):
         self.assertEqual(
@@ -80,12 +110,17 @@ class TestHelpers(TestCase):
             field_name="Unknown",
         )
 
-    @requests_mock.Mocker()
-    def test_issue_exists(self, m):
-        m.register_uri(method="GET", url="https://server/api/issues/1", json={})
+    def test_get_type_adapter(self):
+        self.assertIs(get_type_adapter(tuple[SimpleModel, ...]), get_type_adapter(tuple[SimpleModel, ...]))
+        self.assertEqual(
+            (SimpleModel(id=1), SimpleModel(short_name="Demo")),
+            get_type_adapter(tuple[SimpleModel, ...]).validate_json('[{"id": 1}, {"shortName": "Demo"}]'),
+        )
+
+    def test_issue_exists(self):
+        self.adapter.register_uri(method="GET", url="https://server/api/issues/1", json={})
         self.assertTrue(exists(self.client.get_issue, issue_id="1"))
 
-    @requests_mock.Mocker()
-    def test_issue_not_found(self, m):
-        m.register_uri(method="GET", url="https://server/api/issues/1", status_code=HTTPStatus.NOT_FOUND)
+    def test_issue_not_found(self):
+        self.adapter.register_uri(method="GET", url="https://server/api/issues/1", status_code=HTTPStatus.NOT_FOUND)
         self.assertFalse(exists(self.client.get_issue, issue_id="1"))
@@ -2,7 +2,6 @@ from http import HTTPMethod, HTTPStatus
 from typing import IO, Optional, Sequence, Type
 from urllib.parse import urlencode
 
-from pydantic import TypeAdapter
 from requests import HTTPError, Session
 
 from .entities import (
@@ -22,7 +21,7 @@ from .entities import (
     WorkItemType,
 )
 from .exceptions import YouTrackException, YouTrackNotFound, YouTrackUnauthorized
-from .helpers import model_to_field_names, obj_to_json
+from .helpers import get_type_adapter, model_to_field_names, obj_to_json
 from .types import IssueLinkDirection
 
 
@@ -160,7 +159,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues.html#get_all-Issue-method
         """
-        return TypeAdapter(tuple[model, ...]).validate_json(
+        return get_type_adapter(tuple[model, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/issues/",
@@ -221,7 +220,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-customFields.html#get_all-IssueCustomField-method
         """
-        return TypeAdapter(tuple[IssueCustomFieldType, ...]).validate_json(
+        return get_type_adapter(tuple[IssueCustomFieldType, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/customFields",
@@ -243,7 +242,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/operations-api-issues-issueID-customFields.html#update-IssueCustomField-method
         """
-        return TypeAdapter(IssueCustomFieldType).validate_json(
+        return get_type_adapter(IssueCustomFieldType).validate_json(
             self._post(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/customFields/{field.id}",
@@ -276,7 +275,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-comments.html#get_all-IssueComment-method
         """
-        return TypeAdapter(tuple[IssueComment, ...]).validate_json(
+        return get_type_adapter(tuple[IssueComment, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/comments",
@@ -361,7 +360,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-attachments.html#get_all-IssueAttachment-method
         """
-        return TypeAdapter(tuple[IssueAttachment, ...]).validate_json(
+        return get_type_adapter(tuple[IssueAttachment, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/attachments",
@@ -383,7 +382,7 @@ class Client:
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-attachments.html#create-IssueAttachment-method
         https://www.jetbrains.com/help/youtrack/devportal/api-usecase-attach-files.html
         """
-        return TypeAdapter(tuple[IssueAttachment, ...]).validate_json(
+        return get_type_adapter(tuple[IssueAttachment, ...]).validate_json(
             self._post(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/attachments",
@@ -400,7 +399,7 @@ class Client:
         comment_id: str,
         files: dict[str, IO],
     ) -> Sequence[IssueAttachment]:
-        return TypeAdapter(tuple[IssueAttachment, ...]).validate_json(
+        return get_type_adapter(tuple[IssueAttachment, ...]).validate_json(
             self._post(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/comments/{comment_id}/attachments",
@@ -415,7 +414,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-timeTracking-workItems.html#get_all-IssueWorkItem-method
         """
-        return TypeAdapter(tuple[IssueWorkItem, ...]).validate_json(
+        return get_type_adapter(tuple[IssueWorkItem, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/timeTracking/workItems",
@@ -446,7 +445,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-admin-projects.html#get_all-Project-method
         """
-        return TypeAdapter(tuple[Project, ...]).validate_json(
+        return get_type_adapter(tuple[Project, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/admin/projects",
@@ -468,7 +467,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-admin-projects-projectID-timeTrackingSettings-workItemTypes.html#get_all-WorkItemType-method
         """
-        return TypeAdapter(tuple[WorkItemType, ...]).validate_json(
+        return get_type_adapter(tuple[WorkItemType, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/admin/projects/{project_id}/timeTrackingSettings/workItemTypes",
@@ -484,7 +483,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-tags.html#get_all-Tag-method
         """
-        return TypeAdapter(tuple[Tag, ...]).validate_json(
+        return get_type_adapter(tuple[Tag, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/tags",
@@ -512,7 +511,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-users.html#get_all-User-method
         """
-        return TypeAdapter(tuple[User, ...]).validate_json(
+        return get_type_adapter(tuple[User, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/users",
@@ -533,7 +532,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-links.html#get_all-IssueLink-method
         """
-        return TypeAdapter(tuple[IssueLink, ...]).validate_json(
+        return get_type_adapter(tuple[IssueLink, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/links",
@@ -553,7 +552,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issueLinkTypes.html#get_all-IssueLinkType-method
         """
-        return TypeAdapter(tuple[IssueLinkType, ...]).validate_json(
+        return get_type_adapter(tuple[IssueLinkType, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/issueLinkTypes",
@@ -576,7 +575,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-links-linkID-issues.html#create-Issue-method
         """
-        return TypeAdapter(Issue).validate_json(
+        return get_type_adapter(Issue).validate_json(
             self._post(
                 url=self._build_url(
                     path=f"/issues/{source_issue_id}/links/{link_type_id}{link_direction.value}/issues",
@@ -608,7 +607,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-agiles.html#get_all-Agile-method
         """
-        return TypeAdapter(tuple[Agile, ...]).validate_json(
+        return get_type_adapter(tuple[Agile, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path="/agiles",
@@ -644,7 +643,7 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-agiles-agileID-sprints.html#get_all-Sprint-method
         """
-        return TypeAdapter(tuple[Sprint, ...]).validate_json(
+        return get_type_adapter(tuple[Sprint, ...]).validate_json(
             self._get(
                 url=self._build_url(
                     path=f"/agiles/{agile_id}/sprints",
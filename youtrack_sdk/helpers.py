@@ -1,10 +1,11 @@
 import json
 from copy import deepcopy
-from datetime import UTC, date, datetime, time
+from datetime import UTC, date, datetime, time, timedelta
+from functools import cache
 from itertools import starmap
 from typing import Annotated, Any, Callable, Collection, Optional, Type, Union, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from youtrack_sdk.entities import Issue, IssueCustomFieldType
 from youtrack_sdk.exceptions import YouTrackNotFound
@@ -18,25 +19,35 @@ def deep_update(dest: dict, *mappings: dict) -> dict:
     result = deepcopy(dest)
 
     for source in mappings:
-        for key, value in source.items():
-            if (key in result) and (type(result[key]) is not type(value)):
+        _deep_update_in_place(result, deepcopy(source))
+
+    return result
+
+
+def _deep_update_in_place(dest: dict, source: dict) -> dict:
+    """Same as `deep_update`, but updates `dest` in place and may reuse values of `source` in it.
+
+    Both arguments are expected to be owned by the caller, so nothing is copied.
+    """
+    for key, value in source.items():
+        if (key in dest) and (type(dest[key]) is not type(value)):
+            raise TypeError(
+                f"Destination type '{type(dest[key])}' differs from source type '{type(value)}' for key '{key}'",
+            )
+
+        if (key in dest) and isinstance(value, dict):
+            _deep_update_in_place(dest[key], value)
+        elif (key in dest) and isinstance(value, list):
+            if len(dest[key]) != len(value):
                 raise TypeError(
-                    f"Destination type '{type(result[key])}' differs from source type '{type(value)}' for key '{key}'",
+                    f"Destination list length '{len(dest[key])}' differs from "
+                    f"source list length '{len(value)}' for key '{key}'",
                 )
+            dest[key] = list(starmap(_deep_update_in_place, zip(dest[key], value)))
+        else:
+            dest[key] = value
 
-            if (key in result) and isinstance(value, dict):
-                result[key] = deep_update(result[key], value)
-            elif (key in result) and isinstance(value, list):
-                if len(result[key]) != len(value):
-                    raise TypeError(
-                        f"Destination list length '{len(result[key])}' differs from "
-                        f"source list length '{len(value)}' for key '{key}'",
-                    )
-                result[key] = list(starmap(deep_update, zip(result[key], value)))
-            else:
-                result[key] = value
-
-    return result
+    return dest
 
 
 def model_to_field_names(model: Type[BaseModel] | Union[Type[BaseModel]]) -> Optional[str]:
@@ -86,6 +97,15 @@ def model_to_field_names(model: Type[BaseModel] | Union[Type[BaseModel]]) -> Opt
     return fields_to_csv(fields_dict) or None
 
 
+@cache
+def get_type_adapter[T](type_: Type[T]) -> TypeAdapter[T]:
+    """Returns a shared TypeAdapter for `type_`.
+
+    Building a TypeAdapter compiles a new validator, so it is done once per type instead of once per response.
+    """
+    return TypeAdapter(type_)
+
+
 def obj_to_dict(obj: Optional[BaseModel]) -> Optional[dict]:
     """
     Converts pydantic model instance to dictionary including nested fields.
@@ -95,17 +115,26 @@ def obj_to_dict(obj: Optional[BaseModel]) -> Optional[dict]:
     # to set a field to None explicitly (e.g. to unassign a ticket).
     # `exclude_unset=True` on its own is not sufficient, because the default value
     # for $type fields should be used to simplify the creation of request objects.
-    return obj and deep_update(
+    # Both dumps are fresh objects, so they can be merged in place without copying.
+    return obj and _deep_update_in_place(
         obj.model_dump(by_alias=True, exclude_unset=True),
         obj.model_dump(by_alias=True, exclude_none=True),
     )
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_youtrack_timestamp(dt: datetime) -> int:
+    if dt.utcoffset() is None:
+        # Naive values are interpreted in local time, which only `timestamp()` resolves
+        return int(dt.timestamp() * 1000)
+    # Exact integer arithmetic for aware values, avoids the float round trip of `timestamp()`
+    return (dt - _EPOCH) // timedelta(milliseconds=1)
+
+
 class YouTrackTimestampEncoder(json.JSONEncoder):
     def default(self, obj):
-        def to_youtrack_timestamp(dt: datetime) -> int:
-            return int(dt.timestamp() * 1000)
-
         match obj:
             case datetime():
                 return to_youtrack_timestamp(obj)
@@ -115,8 +144,13 @@ class YouTrackTimestampEncoder(json.JSONEncoder):
                 return json.JSONEncoder.default(self, obj)
 
 
+# The encoder holds no per-call state, so a single instance can be reused instead of creating one per dump.
+# Request bodies are not meant to be read by humans, so they are sent without whitespace after separators.
+_youtrack_json_encoder = YouTrackTimestampEncoder(allow_nan=False, separators=(",", ":"))
+
+
 def custom_json_dumps(obj: Any) -> str:
-    return json.dumps(obj, cls=YouTrackTimestampEncoder, allow_nan=False)
+    return _youtrack_json_encoder.encode(obj)
 
 
 def obj_to_json(obj: Optional[BaseModel]) -> str: